@@ -1,20 +1,27 @@
 import os
-import io
-import shutil
-import base64
+import re
+import asyncio
 import logging
-from typing import Dict, List
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Dict, List, Literal
+from urllib.parse import quote
+import aiofiles
+import anyio.to_thread
+import httpx
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import requests
 
 from services.stt_service import STTService
 from services.tts_service import TTSService
 from services.llm_service import LLMService
+from services.llm_cache import LLMCache
+from services.session_store import SessionStore
 
 # -----------------------
 # Configuration
@@ -25,6 +32,9 @@ load_dotenv()
 MURF_API_KEY = os.getenv("MURF_API_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 ASSEMBLYAI_API_KEY = os.getenv("ASSEMBLYAI_API_KEY")
+REDIS_URL = os.getenv("REDIS_URL")  # Optional: share chat sessions across workers
+# Sessions only survive across workers through Redis, so default to a single worker without it
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY") or (os.cpu_count() if REDIS_URL else 1))
 
 # Validate required environment variables
 if not all([MURF_API_KEY, GEMINI_API_KEY, ASSEMBLYAI_API_KEY]):
@@ -33,6 +43,10 @@ if not all([MURF_API_KEY, GEMINI_API_KEY, ASSEMBLYAI_API_KEY]):
 # Directory setup
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Server-owned data; kept apart from UPLOAD_DIR so uploads can never replace it
+CACHE_DIR = ".cache"
+os.makedirs(CACHE_DIR, exist_ok=True)
+FALLBACK_CACHE_PATH = os.path.join(CACHE_DIR, "fallback_cache.json")
 
 # Logging configuration
 logging.basicConfig(
@@ -41,6 +55,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Reply streaming: flush LLM text to TTS at sentence ends or once a chunk gets long
+SENTENCE_END = re.compile(r"[.?!](?:\s+|$)")
+MAX_SENTENCE_WORDS = 80
+
+# After the first sentence, coalesce sentences into fewer, larger TTS requests
+MAX_TTS_BATCH_CHARS = 400
+MAX_TTS_BATCH_SENTENCES = 8
+
+# Fixed phrases spoken when a request fails; their audio is synthesized once and cached
+FALLBACK_GENERATE_AUDIO = "I'm having trouble connecting right now."
+FALLBACK_TTS_ECHO = "I'm having trouble processing that."
+FALLBACK_LLM_QUERY = "I couldn't process that just now."
+FALLBACK_AGENT_CHAT = "I'm having trouble connecting right now. Let's try again later."
+FALLBACK_TEXTS = [FALLBACK_GENERATE_AUDIO, FALLBACK_TTS_ECHO, FALLBACK_LLM_QUERY, FALLBACK_AGENT_CHAT]
+
+# Worker threads available to blocking SDK calls (e.g. AssemblyAI transcription)
+THREAD_POOL_SIZE = 64
+
+# Read size when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 # -----------------------
 # Pydantic Models
 # -----------------------
@@ -51,13 +86,39 @@ class TTSRequest(BaseModel):
 class LLMRequest(BaseModel):
     text: str
 
+# -----------------------
+# Lifespan
+# -----------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared HTTP client and warm the fallback audio on startup; release everything on shutdown."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    # Shared keep-alive pool for outbound calls (Murf API and audio downloads), so
+    # repeated requests to the same hosts skip the TCP/TLS handshake
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=64, keepalive_expiry=30),
+        timeout=30
+    )
+    tts_service.open(app.state.http)
+    load_fallback_cache()
+    warm_task = asyncio.create_task(warm_fallback_cache())
+    yield
+    warm_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_task
+    await app.state.http.aclose()
+    await session_store.close()
+
 # -----------------------
 # FastAPI App Setup
 # -----------------------
 app = FastAPI(
     title="Alpaca Voice Agent API",
     description="API for Alpaca voice agent with STT, TTS, and LLM capabilities, made during the 30 days of voice agents challenge",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -76,28 +137,197 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Service Initialization
 # -----------------------
 stt_service = STTService(ASSEMBLYAI_API_KEY)
-tts_service = TTSService(MURF_API_KEY)
+tts_service = TTSService(MURF_API_KEY)  # HTTP client and limits attached in lifespan
 llm_service = LLMService(GEMINI_API_KEY)
+llm_cache = LLMCache(llm_service)
+session_store = SessionStore(REDIS_URL)
 
-# In-memory chat storage
-chat_histories: Dict[str, List[Dict[str, str]]] = {}
+# Base64 fallback audio keyed by text, persisted to FALLBACK_CACHE_PATH
+fallback_audio_cache: Dict[str, str] = {}
 
 # -----------------------
 # Helper Functions
 # -----------------------
-def get_fallback_response(fallback_text: str) -> dict:
+def load_fallback_cache():
+    """Load fallback audio persisted by a previous run."""
+    try:
+        with open(FALLBACK_CACHE_PATH, "rb") as f:
+            persisted = orjson.loads(f.read())
+        # Only trust entries for our own phrases that hold base64 strings
+        fallback_audio_cache.update({
+            text: audio for text, audio in persisted.items()
+            if text in FALLBACK_TEXTS and isinstance(audio, str)
+        })
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to load fallback audio cache: {e}")
+
+async def warm_fallback_cache():
+    """Synthesize any fallback phrases missing from the cache and persist the result."""
+    missing = [text for text in FALLBACK_TEXTS if text not in fallback_audio_cache]
+    if not missing:
+        return
+    results = await asyncio.gather(*(tts_service.fallback_audio_base64(text) for text in missing))
+    fallback_audio_cache.update({text: audio for text, audio in zip(missing, results) if audio})
+    # Write to a per-process temp file and swap it in, so concurrent workers never interleave writes
+    tmp_path = f"{FALLBACK_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(orjson.dumps(fallback_audio_cache))
+        os.replace(tmp_path, FALLBACK_CACHE_PATH)
+    except Exception as e:
+        logger.error(f"Failed to persist fallback audio cache: {e}")
+        return
+    logger.info(f"Cached fallback audio for {len(fallback_audio_cache)} phrases")
+
+async def get_fallback_response(fallback_text: str) -> dict:
     """Generate fallback response with audio."""
-    fallback_audio = tts_service.fallback_audio_base64(fallback_text)
+    fallback_audio = fallback_audio_cache.get(fallback_text)
+    if fallback_audio is None:
+        fallback_audio = await tts_service.fallback_audio_base64(fallback_text)
+        if fallback_audio:
+            fallback_audio_cache[fallback_text] = fallback_audio
     return {
         "text": fallback_text,
         "audio_base64": fallback_audio
     }
 
-def download_audio_as_base64(audio_url: str) -> str:
-    """Download audio from URL and convert to base64."""
-    audio_response = requests.get(audio_url)
-    audio_response.raise_for_status()
-    return base64.b64encode(audio_response.content).decode("utf-8")
+def find_sentence_cut(buffer: str) -> int:
+    """Index just past the last complete sentence in buffer, or past the last whole word once it gets long."""
+    last_end = 0
+    for match in SENTENCE_END.finditer(buffer):
+        last_end = match.end()
+    if last_end:
+        return last_end
+    if len(buffer.split()) > MAX_SENTENCE_WORDS:
+        # Never cut inside a word; the trailing partial word stays buffered
+        return max(buffer.rfind(" "), buffer.rfind("\n")) + 1
+    return 0
+
+async def iter_reply_sentences(prompt: str) -> AsyncIterator[str]:
+    """Stream the LLM reply to a prompt, grouped into sentence-sized chunks."""
+    buffer = ""
+    async for token in llm_service.stream_reply(prompt):
+        buffer += token
+        cut = find_sentence_cut(buffer)
+        if cut:
+            if buffer[:cut].strip():
+                yield buffer[:cut].strip()
+            buffer = buffer[cut:]
+    if buffer.strip():
+        yield buffer.strip()
+
+async def coalesce_sentences(sentences: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Pass the first sentence straight through, then group the rest into TTS-sized batches."""
+    batch: List[str] = []
+    batch_chars = 0
+    first = True
+    async for sentence in sentences:
+        if first:
+            first = False
+            yield sentence
+            continue
+        if batch and (batch_chars + len(sentence) > MAX_TTS_BATCH_CHARS or len(batch) >= MAX_TTS_BATCH_SENTENCES):
+            yield " ".join(batch)
+            batch, batch_chars = [], 0
+        batch.append(sentence)
+        batch_chars += len(sentence) + 1
+    if batch:
+        yield " ".join(batch)
+
+async def iter_reply_audio_urls(sentences: AsyncIterator[str], voice_id: str) -> AsyncIterator[str]:
+    """Synthesize sentences concurrently while yielding their audio URLs in order."""
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def dispatch():
+        try:
+            async for sentence in sentences:
+                await queue.put(asyncio.create_task(tts_service.generate_audio(sentence, voice_id)))
+        finally:
+            await queue.put(None)
+
+    dispatcher = asyncio.create_task(dispatch())
+    try:
+        while (task := await queue.get()) is not None:
+            yield await task
+        await dispatcher
+    finally:
+        dispatcher.cancel()
+        while not queue.empty():
+            task = queue.get_nowait()
+            if task is not None:
+                task.cancel()
+
+async def iter_reply_audio(prompt: str, voice_id: str, embedding: np.ndarray | None) -> AsyncIterator[bytes]:
+    """Stream reply audio for a prompt as one MP3 stream, caching the reply once it has been fully spoken."""
+    sentences: List[str] = []
+    audio_urls: List[str] = []
+
+    async def record_sentences():
+        async for sentence in coalesce_sentences(iter_reply_sentences(prompt)):
+            sentences.append(sentence)
+            yield sentence
+
+    async for audio_url in iter_reply_audio_urls(record_sentences(), voice_id):
+        audio_urls.append(audio_url)
+        async for chunk in tts_service.stream_audio(audio_url, strip_tags=True):
+            yield chunk
+    if sentences:
+        llm_cache.store(prompt, embedding, " ".join(sentences), audio_urls)
+
+async def iter_cached_audio(audio_urls: List[str]) -> AsyncIterator[bytes]:
+    """Stream previously generated audio in order as one MP3 stream."""
+    for audio_url in audio_urls:
+        async for chunk in tts_service.stream_audio(audio_url, strip_tags=True):
+            yield chunk
+
+async def synthesize_reply(prompt: str, voice_id: str) -> tuple[str, List[str]]:
+    """Generate the full reply text while synthesizing its sentences concurrently."""
+    sentences: List[str] = []
+    tasks: List[asyncio.Task] = []
+    try:
+        async for sentence in coalesce_sentences(iter_reply_sentences(prompt)):
+            sentences.append(sentence)
+            tasks.append(asyncio.create_task(tts_service.generate_audio(sentence, voice_id)))
+        audio_urls = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    return " ".join(sentences), list(audio_urls)
+
+async def generate_cached_reply(query: str, prompt: str, voice_id: str) -> tuple[str, List[str]]:
+    """Generate a reply to prompt while checking the cache for query, dropping the generation on a hit."""
+    lookup_task = asyncio.create_task(llm_cache.lookup(query))
+    reply_task = asyncio.create_task(synthesize_reply(prompt, voice_id))
+    try:
+        cached, embedding = await lookup_task
+        if cached:
+            return cached.reply, cached.audio_urls
+        llm_output, audio_urls = await reply_task
+    finally:
+        # Settle the losing task so a failure in the dropped generation is not left unretrieved
+        lookup_task.cancel()
+        reply_task.cancel()
+        await asyncio.gather(lookup_task, reply_task, return_exceptions=True)
+
+    if llm_output:
+        llm_cache.store(query, embedding, llm_output, audio_urls)
+    return llm_output, audio_urls
+
+async def prime_audio_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Wait for the first audio chunk so pipeline errors surface before the response starts."""
+    first_chunk = await anext(chunks, None)
+    if first_chunk is None:
+        raise Exception("No audio generated")
+
+    async def replay():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return replay()
 
 # -----------------------
 # Routes
@@ -107,11 +337,22 @@ async def read_index():
     """Serve the main page."""
     return FileResponse("static/index.html")
 
+# Probe responses are constant, so serialize them once
+PING_BODY = orjson.dumps("This Webpage is served using Python's FastAPI")
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "services": {
+        "stt": "operational",
+        "tts": "operational",
+        "llm": "operational"
+    }
+})
+
 @app.get("/ping")
 async def ping():
     """Health check endpoint."""
     logger.info("Ping endpoint accessed")
-    return "This Webpage is served using Python's FastAPI"
+    return Response(content=PING_BODY, media_type="application/json")
 
 @app.post("/generate-audio/")
 async def generate_audio(request: TTSRequest):
@@ -119,14 +360,13 @@ async def generate_audio(request: TTSRequest):
     logger.info(f"Generating audio for text: {request.text[:50]}...")
     
     try:
-        audio_url = tts_service.generate_audio(request.text, request.voice_id)
+        audio_url = await tts_service.generate_audio(request.text, request.voice_id)
         logger.info("Audio generation successful")
         return {"audio_url": audio_url}
     
     except Exception as e:
         logger.error(f"Audio generation failed: {e}")
-        fallback_text = "I'm having trouble connecting right now."
-        fallback_response = get_fallback_response(fallback_text)
+        fallback_response = await get_fallback_response(FALLBACK_GENERATE_AUDIO)
         return {"error": str(e), **fallback_response}
 
 @app.post("/upload-audio/")
@@ -136,13 +376,15 @@ async def upload_audio(file: UploadFile = File(...)):
     
     try:
         file_location = os.path.join(UPLOAD_DIR, file.filename)
-        with open(file_location, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        file_size = 0
+        async with aiofiles.open(file_location, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
+                file_size += len(chunk)
         
-        file_size = os.path.getsize(file_location)
         logger.info(f"File uploaded successfully: {file.filename} ({file_size} bytes)")
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "filename": file.filename,
             "size": file_size,
             "content-type": file.content_type
@@ -158,8 +400,8 @@ async def transcribe_audio(file: UploadFile = File(...)):
     logger.info(f"Transcribing audio file: {file.filename}")
     
     try:
-        audio_data = await file.read()
-        transcription = stt_service.transcribe_audio_bytes(audio_data)
+        # Hand the spooled upload straight to the SDK instead of reading it into memory
+        transcription = await stt_service.transcribe_audio_async(file.file)
         logger.info(f"Transcription successful: {transcription[:50]}...")
         return {"transcription": transcription}
     
@@ -171,119 +413,119 @@ async def transcribe_audio(file: UploadFile = File(...)):
 async def echo_murf_voice(file: UploadFile = File(...)):
     """Echo back the transcribed audio as speech."""
     logger.info("Processing TTS echo request")
-    fallback_text = "I'm having trouble processing that."
+    fallback_text = FALLBACK_TTS_ECHO
     
     try:
-        audio_bytes = await file.read()
-        transcript = stt_service.transcribe_audio_bytes(audio_bytes)
+        transcript = await stt_service.transcribe_audio_async(file.file)
         
         if not transcript:
             raise Exception("No transcription produced")
         
         logger.info(f"Echoing transcription: {transcript[:50]}...")
-        audio_url = tts_service.generate_audio(transcript, "en-US-natalie")
+        audio_url = await tts_service.generate_audio(transcript, "en-US-natalie")
         
-        # Stream the audio response
-        audio_response = requests.get(audio_url)
-        audio_response.raise_for_status()
+        # Pipe the audio through chunk by chunk as it downloads
+        audio_stream = await prime_audio_stream(tts_service.stream_audio(audio_url))
         
-        return StreamingResponse(
-            io.BytesIO(audio_response.content),
-            media_type="audio/mpeg"
-        )
+        return StreamingResponse(audio_stream, media_type="audio/mpeg")
     
     except Exception as e:
         logger.error(f"TTS Echo failed: {e}")
-        fallback_response = get_fallback_response(fallback_text)
-        return JSONResponse(content={"error": str(e), **fallback_response})
+        fallback_response = await get_fallback_response(fallback_text)
+        return ORJSONResponse(content={"error": str(e), **fallback_response})
 
 @app.post("/llm/query")
-async def llm_query(file: UploadFile = File(...)):
-    """Process audio through STT -> LLM -> TTS pipeline."""
+async def llm_query(file: UploadFile = File(...), response_format: Literal["audio", "json"] = "audio"):
+    """Process audio through STT -> LLM -> TTS pipeline, as streamed audio or JSON with text and audio URLs."""
     logger.info("Processing LLM query")
-    fallback_text = "I couldn't process that just now."
+    fallback_text = FALLBACK_LLM_QUERY
     
     try:
         # Transcribe audio
-        audio_bytes = await file.read()
-        transcript = stt_service.transcribe_audio_bytes(audio_bytes)
+        transcript = await stt_service.transcribe_audio_async(file.file)
         
         if not transcript:
             raise Exception("No transcription produced")
         
         logger.info(f"Processing query: {transcript[:50]}...")
         
-        # Generate LLM response
-        llm_output = llm_service.generate_reply(transcript)
-        
-        if not llm_output:
-            raise Exception("No LLM response generated")
+        if response_format == "json":
+            llm_output, audio_urls = await generate_cached_reply(transcript, transcript, "en-US-natalie")
+            if not llm_output:
+                raise Exception("No LLM response generated")
+            return {
+                "transcription": transcript,
+                "text": llm_output,
+                "audio_urls": audio_urls
+            }
         
-        logger.info(f"LLM response: {llm_output[:50]}...")
+        # Reuse the reply to a similar query, otherwise stream the LLM response into TTS
+        cached, embedding = await llm_cache.lookup(transcript)
+        if cached:
+            audio_chunks = iter_cached_audio(cached.audio_urls)
+        else:
+            audio_chunks = iter_reply_audio(transcript, "en-US-natalie", embedding)
+        audio_stream = await prime_audio_stream(audio_chunks)
         
-        # Convert response to audio
-        audio_url = tts_service.generate_audio(llm_output, "en-US-natalie")
-        audio_base64 = download_audio_as_base64(audio_url)
-        
-        return {
-            "text": llm_output,
-            "audio_base64": audio_base64
-        }
+        return StreamingResponse(
+            audio_stream,
+            media_type="audio/mpeg",
+            headers={"X-Transcript": quote(transcript)}
+        )
     
     except Exception as e:
         logger.error(f"LLM query failed: {e}")
-        fallback_response = get_fallback_response(fallback_text)
+        fallback_response = await get_fallback_response(fallback_text)
         return {"error": str(e), **fallback_response}
 
 @app.post("/agent/chat/{sessionId}")
 async def agent_chat(sessionId: str, file: UploadFile = File(...)):
     """Handle conversational AI chat with memory."""
     logger.info(f"Processing chat for session: {sessionId}")
-    fallback_text = "I'm having trouble connecting right now. Let's try again later."
+    fallback_text = FALLBACK_AGENT_CHAT
     
     try:
-        # Transcribe audio
-        audio_bytes = await file.read()
-        transcript = stt_service.transcribe_audio_bytes(audio_bytes)
+        # Transcribe audio while the session history loads
+        transcript, history = await asyncio.gather(
+            stt_service.transcribe_audio_async(file.file),
+            session_store.get(sessionId)
+        )
         
         if not transcript:
             raise Exception("No transcription produced")
         
         logger.info(f"User message: {transcript[:50]}...")
+        first_turn = not history.roles
         
-        # Get or create chat history
-        if sessionId not in chat_histories:
-            chat_histories[sessionId] = []
-        
-        messages = chat_histories[sessionId]
-        messages.append({"role": "user", "content": transcript})
+        # Add user message to chat history
+        context = await session_store.append(sessionId, "user", transcript)
         
-        # Generate LLM response with context
-        conversation_context = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages])
-        llm_output = llm_service.generate_reply(conversation_context)
+        # Generate LLM response with context, synthesizing speech as sentences arrive
+        # Cached replies only fit an opening question, so only race the cache against the
+        # LLM there; later turns depend on the conversation and go straight to generation
+        if first_turn:
+            llm_output, audio_urls = await generate_cached_reply(transcript, context, "en-US-natalie")
+        else:
+            llm_output, audio_urls = await synthesize_reply(context, "en-US-natalie")
         
         if not llm_output:
             raise Exception("No LLM response generated")
         
         # Add assistant response to history
-        messages.append({"role": "assistant", "content": llm_output})
-        chat_histories[sessionId] = messages
+        await session_store.append(sessionId, "assistant", llm_output)
         
         logger.info(f"Assistant response: {llm_output[:50]}...")
         
-        # Convert to audio
-        audio_url = tts_service.generate_audio(llm_output, "en-US-natalie")
-        audio_base64 = download_audio_as_base64(audio_url)
-        
+        # The client plays the generated audio directly from its URLs
         return {
             "transcription": transcript,
             "text": llm_output,
-            "audio_base64": audio_base64
+            "audio_urls": audio_urls
         }
     
     except Exception as e:
         logger.error(f"Agent chat failed: {e}")
-        fallback_response = get_fallback_response(fallback_text)
+        fallback_response = await get_fallback_response(fallback_text)
         return {"error": str(e), **fallback_response}
 
 # -----------------------
@@ -292,8 +534,7 @@ async def agent_chat(sessionId: str, file: UploadFile = File(...)):
 @app.delete("/agent/chat/{sessionId}")
 async def clear_chat_history(sessionId: str):
     """Clear chat history for a session."""
-    if sessionId in chat_histories:
-        del chat_histories[sessionId]
+    if await session_store.delete(sessionId):
         logger.info(f"Cleared chat history for session: {sessionId}")
         return {"message": f"Chat history cleared for session {sessionId}"}
     else:
@@ -302,20 +543,13 @@ async def clear_chat_history(sessionId: str):
 @app.get("/agent/chat/{sessionId}")
 async def get_chat_history(sessionId: str):
     """Get chat history for a session."""
-    messages = chat_histories.get(sessionId, [])
-    return {"session_id": sessionId, "messages": messages}
+    session = await session_store.get(sessionId)
+    return {"session_id": sessionId, "messages": session.messages}
 
 @app.get("/health")
 async def health_check():
     """Comprehensive health check for all services."""
-    return {
-        "status": "healthy",
-        "services": {
-            "stt": "operational",
-            "tts": "operational", 
-            "llm": "operational"
-        }
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 # -----------------------
 # Error Handlers
@@ -323,7 +557,7 @@ async def health_check():
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
     logger.error(f"ValueError: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"error": "Invalid input", "detail": str(exc)}
     )
@@ -331,11 +565,20 @@ async def value_error_handler(request, exc):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error", "detail": "Something went wrong"}
     )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        # "auto" uses uvloop and httptools when installed (uvicorn[standard]) and
+        # falls back to asyncio and h11 where they are unavailable, e.g. on Windows
+        loop="auto",
+        http="auto",
+        workers=WEB_CONCURRENCY
+    )
\ No newline at end of file
@@ -0,0 +1,90 @@
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+
+from services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CachedReply:
+    prompt: str
+    reply: str
+    audio_urls: List[str]
+    created_at: float
+
+class LLMCache:
+    """LRU cache of LLM replies matched by semantic similarity of their prompts."""
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        max_entries: int = 2000,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 24 * 60 * 60
+    ):
+        self.llm_service = llm_service
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        # Murf audio URLs expire, so cached replies only live for a limited time
+        self.ttl_seconds = ttl_seconds
+
+        # Embeddings live in fixed rows of one matrix; free rows stay zero and never match
+        self._matrix: np.ndarray | None = None
+        self._replies: List[CachedReply | None] = [None] * max_entries
+        self._free_slots = list(range(max_entries))
+        self._lru: "OrderedDict[str, int]" = OrderedDict()
+
+    async def lookup(self, prompt: str) -> tuple[CachedReply | None, np.ndarray | None]:
+        """Find a cached reply for a similar prompt; also return the prompt embedding."""
+        try:
+            embedding = np.asarray(await self.llm_service.embed(prompt), dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Prompt embedding failed: {e}")
+            return None, None
+        embedding /= np.linalg.norm(embedding)
+
+        if not self._lru:
+            return None, embedding
+
+        # Cosine similarity against every cached prompt in one batched product
+        similarities = self._matrix @ embedding
+        slot = int(np.argmax(similarities))
+        cached = self._replies[slot]
+        if cached is None or similarities[slot] <= self.similarity_threshold:
+            return None, embedding
+
+        if time.monotonic() - cached.created_at > self.ttl_seconds:
+            self._release(cached.prompt)
+            return None, embedding
+
+        self._lru.move_to_end(cached.prompt)
+        logger.info(f"LLM cache hit (similarity {similarities[slot]:.3f})")
+        return cached, embedding
+
+    def store(self, prompt: str, embedding: np.ndarray | None, reply: str, audio_urls: List[str]):
+        """Cache a reply and its audio, evicting the least recently used entry if full."""
+        if embedding is None:
+            return
+        if self._matrix is None:
+            self._matrix = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+
+        if prompt in self._lru:
+            self._release(prompt)
+        elif not self._free_slots:
+            self._release(next(iter(self._lru)))
+
+        slot = self._free_slots.pop()
+        self._matrix[slot] = embedding
+        self._replies[slot] = CachedReply(prompt, reply, audio_urls, time.monotonic())
+        self._lru[prompt] = slot
+
+    def _release(self, prompt: str):
+        """Drop a cached prompt and free its matrix row."""
+        slot = self._lru.pop(prompt)
+        self._matrix[slot] = 0
+        self._replies[slot] = None
+        self._free_slots.append(slot)
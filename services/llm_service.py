@@ -1,4 +1,5 @@
 import logging
+from typing import AsyncIterator
 from google import genai
 
 logger = logging.getLogger(__name__)
@@ -7,11 +8,14 @@ class LLMService:
     def __init__(self, api_key: str):
         self.client = genai.Client(api_key=api_key)
 
-    def generate_reply(self, prompt: str, model: str = "gemini-2.5-flash") -> str:
-        """Generate LLM text reply."""
-        try:
-            resp = self.client.models.generate_content(model=model, contents=prompt)
-            return resp.text.strip()
-        except Exception as e:
-            logger.error(f"LLM generation failed: {e}")
-            return ""
+    async def stream_reply(self, prompt: str, model: str = "gemini-2.5-flash") -> AsyncIterator[str]:
+        """Stream LLM text reply as it is generated."""
+        stream = await self.client.aio.models.generate_content_stream(model=model, contents=prompt)
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+
+    async def embed(self, text: str, model: str = "text-embedding-004") -> list[float]:
+        """Embed text for semantic similarity comparisons."""
+        resp = await self.client.aio.models.embed_content(model=model, contents=text)
+        return resp.embeddings[0].values
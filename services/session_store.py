@@ -0,0 +1,121 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List
+import redis.asyncio as redis
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Append one message to the parallel role/content lists and extend the cached context,
+# rebuilding the context only when the sliding window drops old messages.
+# KEYS: roles, contents, context; ARGV: role, content, max_messages, ttl_seconds
+APPEND_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+local count = redis.call('RPUSH', KEYS[2], ARGV[2])
+local max_messages = tonumber(ARGV[3])
+local context
+if count > max_messages then
+    redis.call('LTRIM', KEYS[1], -max_messages, -1)
+    redis.call('LTRIM', KEYS[2], -max_messages, -1)
+    local roles = redis.call('LRANGE', KEYS[1], 0, -1)
+    local contents = redis.call('LRANGE', KEYS[2], 0, -1)
+    local lines = {}
+    for i = 1, #roles do
+        lines[i] = roles[i] .. ': ' .. contents[i]
+    end
+    context = table.concat(lines, '\\n')
+    redis.call('SET', KEYS[3], context)
+else
+    local line = ARGV[1] .. ': ' .. ARGV[2]
+    if count == 1 then
+        context = line
+        redis.call('SET', KEYS[3], context)
+    else
+        redis.call('APPEND', KEYS[3], '\\n' .. line)
+        context = redis.call('GET', KEYS[3])
+    end
+end
+for i = 1, 3 do
+    redis.call('EXPIRE', KEYS[i], ARGV[4])
+end
+return context
+"""
+
+@dataclass(slots=True)
+class Session:
+    """Chat history stored as parallel role/content lists plus the joined LLM context."""
+    roles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    context: str = ""
+
+    @property
+    def messages(self) -> List[Dict[str, str]]:
+        return [{"role": role, "content": content} for role, content in zip(self.roles, self.contents)]
+
+class SessionStore:
+    """Chat histories in Redis when configured, otherwise in a bounded process-local LRU cache."""
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        max_sessions: int = 1000,
+        max_messages: int = 40,
+        ttl_seconds: int = 24 * 60 * 60
+    ):
+        # Redis is the source of truth when set, so every worker sees the same history
+        self.redis = redis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self.append_script = self.redis.register_script(APPEND_SCRIPT) if self.redis else None
+        self.cache: LRUCache = LRUCache(maxsize=max_sessions)
+        # Sliding window of messages kept per session (and sent to the LLM)
+        self.max_messages = max_messages
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, session_id: str) -> Session:
+        """Get a session's history, or an empty one if it does not exist."""
+        if self.redis:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lrange(self._key(session_id, "roles"), 0, -1)
+                pipe.lrange(self._key(session_id, "contents"), 0, -1)
+                pipe.get(self._key(session_id, "context"))
+                roles, contents, context = await pipe.execute()
+            return Session(roles, contents, context or "")
+        return self.cache.get(session_id) or Session()
+
+    async def append(self, session_id: str, role: str, content: str) -> str:
+        """Append a message to a session and return its updated rolling context."""
+        if self.redis:
+            return await self.append_script(
+                keys=[self._key(session_id, name) for name in ("roles", "contents", "context")],
+                args=[role, content, self.max_messages, self.ttl_seconds]
+            )
+
+        session = self.cache.get(session_id) or Session()
+        session.roles.append(role)
+        session.contents.append(content)
+        if len(session.roles) > self.max_messages:
+            del session.roles[:-self.max_messages]
+            del session.contents[:-self.max_messages]
+            session.context = "\n".join(
+                f"{role}: {content}" for role, content in zip(session.roles, session.contents)
+            )
+        elif session.context:
+            session.context += f"\n{role}: {content}"
+        else:
+            session.context = f"{role}: {content}"
+        self.cache[session_id] = session
+        return session.context
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session's history, returning whether it existed."""
+        if self.redis:
+            keys = [self._key(session_id, name) for name in ("roles", "contents", "context")]
+            return bool(await self.redis.delete(*keys))
+        return self.cache.pop(session_id, None) is not None
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self.redis:
+            await self.redis.aclose()
+
+    def _key(self, session_id: str, name: str) -> str:
+        return f"chat:{session_id}:{name}"
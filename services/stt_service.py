@@ -1,5 +1,7 @@
+import anyio.to_thread
 import assemblyai as aai
 import logging
+from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
@@ -8,11 +10,15 @@ class STTService:
         aai.settings.api_key = api_key
         self.transcriber = aai.Transcriber()
 
-    def transcribe_audio_bytes(self, audio_bytes: bytes) -> str:
-        """Transcribe audio bytes to text."""
+    def transcribe_audio(self, audio: bytes | BinaryIO) -> str:
+        """Transcribe audio bytes or a binary file object to text."""
         try:
-            transcript = self.transcriber.transcribe(audio_bytes)
+            transcript = self.transcriber.transcribe(audio)
             return transcript.text
         except Exception as e:
             logger.error(f"STT transcription failed: {e}")
             return ""
+
+    async def transcribe_audio_async(self, audio: bytes | BinaryIO) -> str:
+        """Transcribe audio to text without blocking the event loop."""
+        return await anyio.to_thread.run_sync(self.transcribe_audio, audio)
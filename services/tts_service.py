@@ -1,24 +1,73 @@
-import base64
+import asyncio
 import logging
-import requests
+from typing import AsyncIterator
+import anyio.to_thread
+import httpx
+import pybase64
 
 logger = logging.getLogger(__name__)
 
+ID3V2_HEADER_SIZE = 10
+ID3V1_TAG_SIZE = 128
+
+async def strip_id3_tags(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Drop a leading ID3v2 tag and trailing ID3v1 tag so MP3 files can be joined into one stream."""
+    buffer = b""
+    header_checked = False
+    skip = 0
+    async for chunk in chunks:
+        buffer += chunk
+        if not header_checked:
+            if len(buffer) < ID3V2_HEADER_SIZE:
+                continue
+            header_checked = True
+            if buffer[:3] == b"ID3":
+                # Tag size is a 28-bit syncsafe integer, plus an optional 10-byte footer
+                size = (
+                    (buffer[6] & 0x7F) << 21 | (buffer[7] & 0x7F) << 14
+                    | (buffer[8] & 0x7F) << 7 | (buffer[9] & 0x7F)
+                )
+                skip = ID3V2_HEADER_SIZE + size + (ID3V2_HEADER_SIZE if buffer[5] & 0x10 else 0)
+        if skip:
+            dropped = min(skip, len(buffer))
+            buffer = buffer[dropped:]
+            skip -= dropped
+        # Hold back enough bytes to recognise an ID3v1 tag at the very end
+        if len(buffer) > ID3V1_TAG_SIZE:
+            yield buffer[:-ID3V1_TAG_SIZE]
+            buffer = buffer[-ID3V1_TAG_SIZE:]
+    if len(buffer) == ID3V1_TAG_SIZE and buffer[:3] == b"TAG":
+        buffer = b""
+    if buffer:
+        yield buffer
+
 class TTSService:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_concurrency: int = 16):
         self.api_key = api_key
         self.api_url = "https://api.murf.ai/v1/speech/generate"
+        self.max_concurrency = max_concurrency
+        # Both are bound to the running event loop, so they are created in open()
+        self.client: httpx.AsyncClient | None = None
+        self.semaphore: asyncio.Semaphore | None = None
+
+    def open(self, client: httpx.AsyncClient):
+        """Attach the shared HTTP client and a fresh concurrency limit for the running loop."""
+        self.client = client
+        # Global cap on in-flight Murf requests to stay clear of rate limiting
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
 
-    def generate_audio(self, text: str, voice_id: str) -> str:
+    async def generate_audio(self, text: str, voice_id: str) -> str:
         """Generate audio URL from text."""
         headers = {
             "accept": "application/json",
             "content-type": "application/json",
             "api-key": self.api_key
         }
-        payload = {"text": text, "voice_id": voice_id}
+        # MP3 frames can be concatenated, so multi-segment replies play as one stream
+        payload = {"text": text, "voice_id": voice_id, "format": "MP3"}
 
-        resp = requests.post(self.api_url, json=payload, headers=headers)
+        async with self.semaphore:
+            resp = await self.client.post(self.api_url, json=payload, headers=headers)
         if resp.status_code != 200:
             raise Exception(f"Murf API failed: {resp.text}")
 
@@ -27,12 +76,31 @@ class TTSService:
             raise Exception("No audioFile returned from Murf")
         return audio_url
 
-    def fallback_audio_base64(self, fallback_text: str) -> str | None:
+    async def download_audio(self, audio_url: str) -> bytes:
+        """Download generated audio from its URL."""
+        resp = await self.client.get(audio_url)
+        resp.raise_for_status()
+        return resp.content
+
+    async def stream_audio(
+        self, audio_url: str, chunk_size: int = 65536, strip_tags: bool = False
+    ) -> AsyncIterator[bytes]:
+        """Stream generated audio from its URL chunk by chunk, optionally without ID3 tags."""
+        async with self.client.stream("GET", audio_url) as resp:
+            resp.raise_for_status()
+            chunks = resp.aiter_bytes(chunk_size)
+            if strip_tags:
+                chunks = strip_id3_tags(chunks)
+            async for chunk in chunks:
+                yield chunk
+
+    async def fallback_audio_base64(self, fallback_text: str) -> str | None:
         """Fallback to default Murf voice and return base64 audio."""
         try:
-            audio_url = self.generate_audio(fallback_text, "en-US-natalie")
-            audio_file_resp = requests.get(audio_url)
-            return base64.b64encode(audio_file_resp.content).decode("utf-8")
+            audio_url = await self.generate_audio(fallback_text, "en-US-natalie")
+            audio_content = await self.download_audio(audio_url)
+            # Encode in a worker thread so large clips don't stall the event loop
+            return await anyio.to_thread.run_sync(pybase64.b64encode_as_string, audio_content)
         except Exception as e:
             logger.error(f"Murf fallback failed: {e}")
             return None
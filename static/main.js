@@ -7,6 +7,9 @@ let mediaRecorder;
 let audioChunks = [];
 let isRecording = false;
 
+// Reply audio URLs still waiting to be played
+let pendingAudioUrls = [];
+
 // Session ID handling (unique per user/browser session)
 let sessionId = new URLSearchParams(window.location.search).get("session_id");
 if (!sessionId) {
@@ -118,6 +121,9 @@ async function processRecording() {
 
         const data = await response.json();
 
+        // Drop any segments still queued from the previous reply
+        pendingAudioUrls = [];
+
         // If backend returned error
         if (data.error) {
             console.warn("Backend error:", data.error);
@@ -142,22 +148,12 @@ async function processRecording() {
             </div>
         `);
 
-        // Decode and play audio response
-        try {
-            const audioBinary = atob(data.audio_base64);
-            const audioBuffer = new Uint8Array(audioBinary.length);
-            for (let i = 0; i < audioBinary.length; i++) {
-                audioBuffer[i] = audioBinary.charCodeAt(i);
-            }
-            const audioFileBlob = new Blob([audioBuffer], { type: 'audio/mpeg' });
-            const audioURL = URL.createObjectURL(audioFileBlob);
-
-            playBack.src = audioURL;
-            playBack.play();
-        } catch (err) {
-            console.error("Audio decode failed:", err);
-            playFallbackAudio();
-        }
+        // Play the reply audio straight from its URLs, one sentence after another
+        pendingAudioUrls = data.audio_urls.slice(1);
+        playBack.src = data.audio_urls[0];
+        playBack.play().catch(err => {
+            console.error("Audio playback failed:", err);
+        });
 
     } catch (err) {
         console.error("Error talking to backend:", err);
@@ -169,6 +165,7 @@ async function processRecording() {
 
 // Play backup audio if API call fails
 function playFallbackAudio() {
+    pendingAudioUrls = [];
     updateStatus("I'm having trouble connecting right now, but I'm still here.", false, "Connection issue");
     const fallbackAudio = new Audio("/static/fallback.mp3");
     fallbackAudio.play().catch(err => console.warn("Fallback audio failed:", err));
@@ -215,8 +212,13 @@ function resetRecordButton() {
     recordButton.textContent = "🎤 Start Recording";
 }
 
-// Auto-restart recording after audio playback ends
+// Play the next reply segment, or auto-restart recording after audio playback ends
 playBack.addEventListener('ended', () => {
+    if (pendingAudioUrls.length > 0) {
+        playBack.src = pendingAudioUrls.shift();
+        playBack.play().catch(err => console.error("Audio playback failed:", err));
+        return;
+    }
     setTimeout(() => {
         if (!isRecording) {
             startRecording();